@@ -10,9 +10,13 @@ bl_info = {
 
 from pickle import TRUE
 import bpy
+import queue
+import re
 import socket
 import struct
+import sys
 import threading
+import time
 
 try:
     from typing import Dict
@@ -22,93 +26,233 @@ except Exception:
 # --- Config ---
 DEBUG = False               # set True for console logs
 APPLY_INTERVAL = 0.016      # seconds; ~60 Hz continuous application
+IDLE_INTERVAL = 0.25        # seconds; slow re-arm while no window is visible
 
 # --- Module state ---
 _rx_thread = None
 _stop_flag = False
-_lock = threading.Lock()
 _last_value = None
 _current_host = "localhost"
 _current_port = 10000
-_rx_values: Dict[str, float] = {}
+# Listener -> apply-timer handoff: the UDP thread enqueues (addr, value)
+# pairs, the timer drains them on the main thread. SimpleQueue's put/get
+# fast path is lock-free on CPython, so the threads never serialize.
+_rx_q = queue.SimpleQueue()
 _sock = None
 _last_keyed_frame: Dict[str, int] = {}
+# Caches keyed by datapath; avoid re-parsing the expression and re-querying
+# the target RNA type on every apply tick. Invalidated when a datapath is edited.
+_resolved_cache: Dict[str, tuple] = {}
+_coerce_cache: Dict[str, str] = {}
+# Last value actually written per datapath; identical successive values skip
+# the RNA write (and the depsgraph work it triggers) entirely.
+_applied_cache: Dict[str, float] = {}
+# Compiled snapshot of the enabled mappings as norm_addr -> [datapaths].
+# The timer iterates the (usually small) set of addresses received this tick
+# and joins through this dict, instead of checking every mapping; rebuilt
+# whenever a mapping is edited, added or removed. None means "rebuild".
+_addr_to_mappings = None
+_compiled_src_count = -1
 
 # --- Minimal OSC parsing with bundle support and f/i/d ---
 
+# Precompiled unpackers; unpack_from avoids both format re-parsing and the
+# temporary bytes slice per argument
+_F = struct.Struct(">f")
+_I = struct.Struct(">i")
+_D = struct.Struct(">d")
+_SZ = struct.Struct(">i")
+
+# Typetag jump table: tag -> (unpacker, size, post-cast); avoids the per-char
+# if/elif cascade for multi-arg messages
+_TAG_HANDLERS = {
+    "f": (_F.unpack_from, 4, None),
+    "i": (_I.unpack_from, 4, float),
+    "d": (_D.unpack_from, 8, None),
+}
+
 def _pad4(n): return (4 - (n % 4)) % 4
 
-def _parse_msg(buf: bytes):
-    i0 = buf.find(b"\x00")
-    if i0 < 0: raise ValueError("no addr nul")
-    addr = buf[:i0].decode("utf-8", "ignore")
-    p = i0 + 1 + _pad4(i0 + 1)
+def _parse_msg(buf, start=0, end=None):
+    """Parse an OSC message from buf[start:end] into (addr, first_value_or_None).
+    Only the first argument is decoded; it is all the apply loop ever reads.
+    Works on bytes or a reused bytearray — padding is relative to start."""
+    if end is None:
+        end = len(buf)
+    try:
+        i0 = buf.index(b"\x00", start, end)
+    except ValueError:
+        raise ValueError("no addr nul")
+    addr = buf[start:i0].decode("utf-8", "ignore")
+    p = i0 + 1 + _pad4(i0 + 1 - start)
 
-    i1rel = buf[p:].find(b"\x00")
-    if i1rel < 0: raise ValueError("no typetags nul")
-    i1 = p + i1rel
+    # index(start=p) scans in place; buf[p:].find would copy the tail first
+    try:
+        i1 = buf.index(b"\x00", p, end)
+    except ValueError:
+        raise ValueError("no typetags nul")
     tags = buf[p:i1].decode("utf-8", "ignore")
-    p = i1 + 1 + _pad4((i1 - 0) + 1)
+    p = i1 + 1 + _pad4(i1 + 1 - start)
     if not tags.startswith(","):
         raise ValueError("bad typetags")
 
-    args = []
-    for t in tags[1:]:
-        if t == "f":
-            args.append(struct.unpack(">f", buf[p:p+4])[0]); p += 4
-        elif t == "i":
-            args.append(float(struct.unpack(">i", buf[p:p+4])[0])); p += 4
-        elif t == "d":
-            args.append(struct.unpack(">d", buf[p:p+8])[0]); p += 8
-        else:
-            raise ValueError(f"unsupported type {t!r}")
-    return addr, args
-
-def _parse_osc(buf: bytes):
-    if buf.startswith(b"#bundle\x00"):
+    if len(tags) < 2:
+        return addr, None
+    t = tags[1]
+    h = _TAG_HANDLERS.get(t)
+    if h is None:
+        raise ValueError(f"unsupported type {t!r}")
+    unpack, _size, post = h
+    v = unpack(buf, p)[0]
+    return addr, (post(v) if post is not None else v)
+
+def _parse_osc(buf, end=None):
+    if end is None:
+        end = len(buf)
+    if end >= 16 and buf.startswith(b"#bundle\x00"):
         p = 16  # "#bundle\0" (8) + timetag (8)
-        while p + 4 <= len(buf):
-            (sz,) = struct.unpack(">i", buf[p:p+4]); p += 4
-            if sz <= 0 or p + sz > len(buf): break
-            msg = buf[p:p+sz]; p += sz
+        while p + 4 <= end:
+            sz = _SZ.unpack_from(buf, p)[0]; p += 4
+            if sz <= 0 or p + sz > end: break
             try:
-                yield _parse_msg(msg)
+                yield _parse_msg(buf, p, p + sz)
             except Exception:
-                continue
+                pass
+            p += sz
     else:
-        yield _parse_msg(buf)
+        yield _parse_msg(buf, 0, end)
+
+# Optional native parser: if a compiled tiny_osc_parse module (e.g. a Cython
+# or C build of the two functions above) sits next to the addon, prefer it.
+# The pure-Python parser stays as the fallback and reference implementation.
+try:
+    from tiny_osc_parse import parse_osc as _parse_osc_native
+    _parse_osc = _parse_osc_native
+except Exception:
+    pass
 
 # --- Network listener thread ---
 
+# On Linux, recvmmsg(2) dequeues a whole batch of datagrams per syscall,
+# which keeps the listener ahead of bursty senders (e.g. parameter sweeps).
+# Falls back to plain recvfrom on other platforms or if ctypes setup fails.
+_RECVMMSG_VLEN = 32
+_RECV_BUFSIZE = 2048
+_recvmmsg_c = None
+if sys.platform.startswith("linux"):
+    try:
+        import ctypes
+
+        class _iovec(ctypes.Structure):
+            _fields_ = [
+                ("iov_base", ctypes.c_void_p),
+                ("iov_len", ctypes.c_size_t),
+            ]
+
+        class _msghdr(ctypes.Structure):
+            _fields_ = [
+                ("msg_name", ctypes.c_void_p),
+                ("msg_namelen", ctypes.c_uint32),
+                ("msg_iov", ctypes.POINTER(_iovec)),
+                ("msg_iovlen", ctypes.c_size_t),
+                ("msg_control", ctypes.c_void_p),
+                ("msg_controllen", ctypes.c_size_t),
+                ("msg_flags", ctypes.c_int),
+            ]
+
+        class _mmsghdr(ctypes.Structure):
+            _fields_ = [
+                ("msg_hdr", _msghdr),
+                ("msg_len", ctypes.c_uint),
+            ]
+
+        _libc = ctypes.CDLL("libc.so.6", use_errno=True)
+        _recvmmsg_c = _libc.recvmmsg
+        _recvmmsg_c.argtypes = [
+            ctypes.c_int,
+            ctypes.POINTER(_mmsghdr),
+            ctypes.c_uint,
+            ctypes.c_int,
+            ctypes.c_void_p,
+        ]
+        _recvmmsg_c.restype = ctypes.c_int
+        # Block for the first datagram only; drain the rest non-blocking
+        _MSG_WAITFORONE = 0x10000
+    except Exception:
+        _recvmmsg_c = None
+
+def _handle_datagram(data, end=None):
+    put = _rx_q.put_nowait
+    for addr, v in _parse_osc(data, end):
+        if v is not None:
+            put((addr, v))
+            # No hold-last: do not track last values
+            if DEBUG: print(f"[OSC] {addr} {v}")
+
+# One fixed receive buffer, reused for every datagram: recvfrom_into writes
+# in place instead of allocating a fresh bytes object per packet
+_RECV_BUF = bytearray(_RECV_BUFSIZE)
+
+def _recv_loop(sock):
+    # Hot-path locals; _stop_flag stays a global read so stop is seen
+    buf = _RECV_BUF
+    recv = sock.recvfrom_into
+    handle = _handle_datagram
+    while not _stop_flag:
+        try:
+            n, _ = recv(buf)
+        except OSError:
+            break
+        # Shutdown wakes the recv with an empty read; re-check the flag
+        if _stop_flag:
+            break
+        if n:
+            handle(buf, n)
+
+def _recv_loop_mmsg(sock):
+    # Buffers, iovecs and headers are allocated once and reused per batch;
+    # the kernel writes straight into the bytearrays, no per-packet copies
+    bufs = [bytearray(_RECV_BUFSIZE) for _ in range(_RECVMMSG_VLEN)]
+    cbufs = [(ctypes.c_char * _RECV_BUFSIZE).from_buffer(b) for b in bufs]
+    iovecs = (_iovec * _RECVMMSG_VLEN)()
+    hdrs = (_mmsghdr * _RECVMMSG_VLEN)()
+    for i in range(_RECVMMSG_VLEN):
+        iovecs[i].iov_base = ctypes.cast(cbufs[i], ctypes.c_void_p)
+        iovecs[i].iov_len = _RECV_BUFSIZE
+        hdrs[i].msg_hdr.msg_iov = ctypes.pointer(iovecs[i])
+        hdrs[i].msg_hdr.msg_iovlen = 1
+    fd = sock.fileno()
+    recvmmsg = _recvmmsg_c
+    vlen = _RECVMMSG_VLEN
+    flags = _MSG_WAITFORONE
+    handle = _handle_datagram
+    while not _stop_flag:
+        n = recvmmsg(fd, hdrs, vlen, flags, None)
+        if n <= 0 or _stop_flag:
+            # Socket shut down or errored; treat like the OSError break above
+            break
+        for i in range(n):
+            ln = hdrs[i].msg_len
+            if ln:
+                handle(bufs[i], ln)
+
 def _listener():
-    global _last_value, _sock
+    global _sock
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         _sock = sock
         sock.bind((_current_host, _current_port))
-        sock.settimeout(0.1)
+        # Blocking recv; _stop_system wakes us via socket.shutdown()
         if DEBUG: print(f"[OSC] Listening {_current_host}:{_current_port}")
     except Exception as e:
         print(f"[OSC] Failed to bind {_current_host}:{_current_port} -> {e}")
         return
 
     try:
-        while not _stop_flag:
-            try:
-                data, _ = sock.recvfrom(2048)
-            except socket.timeout:
-                continue
-            except OSError:
-                break
-
-            for addr, args in _parse_osc(data):
-                if args:
-                    v = float(args[0])
-                    with _lock:
-                        _last_value = v
-                        _rx_values[addr] = v
-                        # No hold-last: do not track last values
-                    if DEBUG: print(f"[OSC] {addr} {v}")
+        if _recvmmsg_c is not None:
+            _recv_loop_mmsg(sock)
+        else:
+            _recv_loop(sock)
     finally:
         try: sock.close()
         except: pass
@@ -117,7 +261,26 @@ def _listener():
 
 # --- Continuous apply timer (always while running) ---
 
+# Visibility backoff state: probe at most once a second, and park received
+# values (last value per address) while no window can show the result.
+_last_visible_check = 0.0
+_windows_visible = True
+_pending_rx: Dict[str, float] = {}
+
+def _windows_are_visible():
+    """Best-effort check that a window with a screen is up. bpy has no
+    minimized/focus API, so this mainly catches background/headless runs;
+    when in doubt, report visible."""
+    try:
+        wm = bpy.context.window_manager
+        if wm is None or not wm.windows:
+            return False
+        return any(w.screen is not None for w in wm.windows)
+    except Exception:
+        return True
+
 def _apply_timer():
+    global _last_value
     if _stop_flag:
         return None
 
@@ -132,44 +295,91 @@ def _apply_timer():
             pass
         return APPLY_INTERVAL
 
-    # Apply incoming values to each configured mapping (absolute datapaths)
-    mappings = getattr(scn, "oscrec_mappings", [])
-    for item in mappings:
-        # Skip disabled mappings
+    # Drain this tick's received values into a local dict (last write per
+    # address wins); the mapping loop below runs on main-thread state only.
+    rx_snapshot = {}
+    q_get = _rx_q.get_nowait
+    try:
+        while True:
+            a, v = q_get()
+            rx_snapshot[a] = v
+    except queue.Empty:
+        pass
+    if rx_snapshot:
+        _last_value = v
+
+    # Visibility backoff: when no usable window is up, don't spend RNA writes
+    # and redraws on things nobody can see — park the values (latest per
+    # address, so memory stays bounded) and re-arm slowly. The listener keeps
+    # running, and the parked values are applied on the first visible tick.
+    global _windows_visible, _last_visible_check, _pending_rx
+    now = time.monotonic()
+    if now - _last_visible_check >= 1.0:
+        _windows_visible = _windows_are_visible()
+        _last_visible_check = now
+    if not _windows_visible:
+        _pending_rx.update(rx_snapshot)
+        return IDLE_INTERVAL
+    if _pending_rx:
+        _pending_rx.update(rx_snapshot)
+        rx_snapshot = _pending_rx
+        _pending_rx = {}
+
+    # Idle skip: nothing arrived since last tick, so there is nothing to
+    # apply, no status change and no reason to redraw editors
+    if not rx_snapshot:
+        # Still auto-disable Record Keyframes if playback stopped meanwhile
         try:
-            if hasattr(item, "enabled") and not item.enabled:
-                continue
+            if getattr(wm, "oscrec_record_keys", False):
+                playing = getattr(bpy.context.screen, "is_animation_playing", False)
+                if not playing:
+                    wm.oscrec_record_keys = False
         except Exception:
             pass
-        addr = item.address
-        # Normalize mapping address to start with '/'
-        if addr and not addr.startswith('/'):
-            addr = '/' + addr
-        val = None
-        with _lock:
-            if addr in _rx_values:
-                val = _rx_values.get(addr)
-            # No hold-last fallback; require fresh value in this frame
-        if val is None:
+        return APPLY_INTERVAL
+
+    # Decide once per tick whether keyframes get recorded this frame
+    recording = getattr(wm, "oscrec_record_keys", False)
+    playing = getattr(bpy.context.screen, "is_animation_playing", False) if recording else False
+    frame = scn.frame_current if (recording and playing) else None
+    to_key = []
+
+    # Apply incoming values to the mapped datapaths (absolute datapaths).
+    # Iterate the addresses that actually arrived this tick — usually far
+    # fewer than the mappings — and join through the compiled table. The
+    # length check catches collections restored behind our back (file load,
+    # undo). Hot-path locals: LOAD_FAST beats LOAD_GLOBAL in the loop.
+    addr_map = _addr_to_mappings
+    if addr_map is None or _compiled_src_count != len(getattr(scn, "oscrec_mappings", [])):
+        addr_map = _compile_mappings(scn)
+    map_get = addr_map.get
+    last_keyed = _last_keyed_frame
+    apply_value = _apply_mapping_value
+    for addr, val in rx_snapshot.items():
+        # No hold-last: only addresses fresh in this frame ever get here
+        datapaths = map_get(addr)
+        if not datapaths:
             continue
+        val = float(val)
+        for datapath in datapaths:
+            try:
+                apply_value(datapath, val)
+            except Exception as e:
+                print(f"[OSC] Failed to set datapath '{datapath}': {e}")
+                continue
+
+            # Optional keyframe recording on each frame while playing;
+            # collected here and inserted as a batch after the RNA writes
+            if frame is not None and last_keyed.get(datapath) != frame:
+                to_key.append(datapath)
+
+    # Issue the keyframe inserts for this tick in one pass
+    for dp in to_key:
         try:
-            _apply_mapping_value(item, float(val))
+            _insert_keyframe_for_absolute(dp, frame)
+            _last_keyed_frame[dp] = frame
         except Exception as e:
-            print(f"[OSC] Failed to set datapath '{item.datapath}': {e}")
-            continue
-
-        # Optional keyframe recording on each frame while playing
-        if getattr(wm, "oscrec_record_keys", False):
-            playing = getattr(bpy.context.screen, "is_animation_playing", False)
-            if playing:
-                frame = bpy.context.scene.frame_current
-                key = f"{item.datapath}"
-                if _last_keyed_frame.get(key) != frame:
-                    try:
-                        _insert_keyframe_for_absolute(item.datapath, frame)
-                        _last_keyed_frame[key] = frame
-                    except Exception as e:
-                        print(f"[OSC] Keyframe failed for '{item.datapath}': {e}")
+            print(f"[OSC] Keyframe failed for '{dp}': {e}")
 
     # If playback stopped, auto-disable Record Keyframes so UI and mute state stay consistent
     try:
@@ -181,74 +391,121 @@ def _apply_timer():
         pass
 
     # Update status text while running
+    status = ""
     try:
-        with _lock:
-            lv = _last_value
-        wm.oscrec_last_value_text = (f"{lv:.4f}" if lv is not None else "")
+        lv = _last_value
+        status = (f"{lv:.4f}" if lv is not None else "")
+        wm.oscrec_last_value_text = status
     except Exception:
         pass
-    # Ping UI to redraw so status updates
-    _redraw_editors()
+    # Ping UI to redraw so status updates (throttled)
+    _redraw_editors(status)
     return APPLY_INTERVAL
 
-def _split_expr_index(expr: str):
-    """Split a trailing [index] from a full python-style expression.
-    Returns (base_expr, index_or_None)."""
-    if expr.endswith("]"):
-        lb = expr.rfind("[")
-        if lb != -1:
-            idx_str = expr[lb+1:-1]
-            if idx_str.isdigit():
-                return expr[:lb], int(idx_str)
-    return expr, None
-
-def _find_last_attr_dot(expr: str) -> int:
-    """Return index of the last attribute dot (.) not inside brackets or quotes; -1 if none."""
-    depth = 0
-    in_str = False
-    str_ch = ''
-    last_dot = -1
-    i = 0
-    while i < len(expr):
-        ch = expr[i]
-        if in_str:
-            if ch == str_ch:
-                in_str = False
-            elif ch == "\\" and i + 1 < len(expr):
-                i += 1  # skip escaped char
+_ATTR_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+def _walk_path(expr: str):
+    """Tokenize an absolute datapath like bpy.data.objects["Cube"].rotation_euler[2]
+    into .attr / ["key"] / [int] segments, walk it from bpy via getattr/getitem,
+    and return (owner_object, attr_name, index_or_None). No eval involved."""
+    s = expr.strip()
+    if not (s == "bpy" or s.startswith("bpy.") or s.startswith("bpy[")):
+        raise ValueError(f"Datapath must start with 'bpy': {expr}")
+    tokens = []
+    i = 3
+    n = len(s)
+    while i < n:
+        ch = s[i]
+        if ch == '.':
+            # One C-level scan for the attribute name instead of a per-char loop
+            m = _ATTR_RE.match(s, i + 1)
+            if m is None:
+                raise ValueError(f"Bad attribute name in datapath: {expr}")
+            tokens.append(('attr', m.group()))
+            i = m.end()
+        elif ch == '[':
+            i += 1
+            if i < n and s[i] in ('"', "'"):
+                q = s[i]
+                i += 1
+                chars = []
+                while i < n and s[i] != q:
+                    if s[i] == "\\" and i + 1 < n:
+                        i += 1  # skip escaped char
+                    chars.append(s[i])
+                    i += 1
+                if i >= n or i + 1 >= n or s[i+1] != ']':
+                    raise ValueError(f"Unterminated key in datapath: {expr}")
+                i += 2  # closing quote + ']'
+                tokens.append(('key', ''.join(chars)))
+            else:
+                j = s.find(']', i)
+                if j == -1:
+                    raise ValueError(f"Unterminated index in datapath: {expr}")
+                try:
+                    tokens.append(('idx', int(s[i:j])))
+                except ValueError:
+                    raise ValueError(f"Bad index {s[i:j]!r} in datapath: {expr}")
+                i = j + 1
         else:
-            if ch in ('"', "'"):
-                in_str = True
-                str_ch = ch
-            elif ch == '[':
-                depth += 1
-            elif ch == ']':
-                depth = max(0, depth - 1)
-            elif ch == '.' and depth == 0:
-                last_dot = i
-        i += 1
-    return last_dot
-
-def _split_owner_and_attr(base_expr: str):
-    """Split owner python expr and attribute name from a base expression without [index]."""
-    dot = _find_last_attr_dot(base_expr)
-    if dot == -1:
-        # e.g. base_expr could be just an attribute on a top-level object without dot (unlikely)
-        raise ValueError(f"Cannot determine owner for expression: {base_expr}")
-    owner_expr = base_expr[:dot]
-    attr = base_expr[dot+1:]
-    return owner_expr, attr
-
-def _eval_expr(expr: str):
-    return eval(expr, {"__builtins__": {} , "bpy": bpy}, {})
+            raise ValueError(f"Unexpected character {ch!r} in datapath: {expr}")
+    # A trailing [int] is the array index; the attr before it is the target
+    idx = None
+    if tokens and tokens[-1][0] == 'idx':
+        idx = tokens[-1][1]
+        tokens = tokens[:-1]
+    if not tokens or tokens[-1][0] != 'attr':
+        raise ValueError(f"Cannot determine owner for expression: {expr}")
+    attr = tokens[-1][1]
+    owner = bpy
+    for kind, val in tokens[:-1]:
+        owner = getattr(owner, val) if kind == 'attr' else owner[val]
+    return owner, attr, idx
 
 def _resolve_owner_attr_idx(abs_expr: str):
     """From an absolute expression like bpy.data.objects["Cube"].rotation_euler[2]
     return (owner_object, attr_name, index_or_None)."""
-    base_expr, idx = _split_expr_index(abs_expr)
-    owner_expr, attr = _split_owner_and_attr(base_expr)
-    owner = _eval_expr(owner_expr)
-    return owner, attr, idx
+    cached = _resolved_cache.get(abs_expr)
+    if cached is not None:
+        return cached
+    resolved = _walk_path(abs_expr)
+    _resolved_cache[abs_expr] = resolved
+    return resolved
+
+def _normalize_addr(a: str) -> str:
+    return ('/' + a) if a and not a.startswith('/') else a
+
+def _invalidate_compiled(self=None, context=None):
+    """A mapping was edited/added/removed; recompile the table next tick."""
+    global _addr_to_mappings
+    _addr_to_mappings = None
+
+def _compile_mappings(scn):
+    """Snapshot the enabled mappings into a norm_addr -> [datapaths] dict."""
+    global _addr_to_mappings, _compiled_src_count
+    src = getattr(scn, "oscrec_mappings", [])
+    out = {}
+    for item in src:
+        try:
+            if hasattr(item, "enabled") and not item.enabled:
+                continue
+            out.setdefault(_normalize_addr(item.address), []).append(item.datapath)
+        except Exception:
+            continue
+    _addr_to_mappings = out
+    _compiled_src_count = len(src)
+    return out
+
+def _addr_update(self, context):
+    """An address was edited; recompile so the loop sees the normalized form."""
+    _invalidate_compiled()
+
+def _datapath_update(self, context):
+    """A datapath was edited; drop cached resolutions so they re-resolve."""
+    _resolved_cache.clear()
+    _coerce_cache.clear()
+    _applied_cache.clear()
+    _invalidate_compiled()
 
 def _set_absolute_datapath_value(abs_expr: str, value: float):
     owner, attr, idx = _resolve_owner_attr_idx(abs_expr)
@@ -259,51 +516,72 @@ def _set_absolute_datapath_value(abs_expr: str, value: float):
         vec = getattr(owner, attr)
         vec[idx] = value
 
-def _coerce_for_target(owner, attr: str, idx, value_f: float):
-    # Determine target RNA type when AUTO
-    def infer_target_type():
+def _infer_target_tag(owner, attr: str, idx) -> str:
+    """Inspect the target RNA/property and return a canonical type tag:
+    'BOOL', 'INT', 'ENUM' or 'FLOAT'."""
+    try:
+        prop = owner.bl_rna.properties.get(attr)
+        if prop is None:
+            # Attribute may be on nested RNA or custom; fallback to current value type
+            cur = getattr(owner, attr)
+            target = type(cur if idx is None else cur[idx])
+        else:
+            target = prop.type  # 'BOOLEAN', 'INT', 'FLOAT', 'ENUM', etc.
+    except Exception:
         try:
-            prop = owner.bl_rna.properties.get(attr)
-            if prop is None:
-                # Attribute may be on nested RNA or custom; fallback to current value type
-                cur = getattr(owner, attr)
-                if idx is None:
-                    return type(cur)
-                else:
-                    return type(cur[idx])
-            subtype = prop.type  # 'BOOLEAN', 'INT', 'FLOAT', 'ENUM', etc.
-            return subtype
+            cur = getattr(owner, attr)
+            target = type(cur if idx is None else cur[idx])
         except Exception:
-            try:
-                cur = getattr(owner, attr)
-                return type(cur if idx is None else cur[idx])
-            except Exception:
-                return float
-
-    target = infer_target_type()
-    # Handle RNA prop type strings
+            target = float
     if isinstance(target, str):
         t = target
     else:
         t = target.__name__ if hasattr(target, '__name__') else str(target)
     t = t.upper()
     if 'BOOL' in t:
-        return bool(value_f > 0.0)
+        return 'BOOL'
     if 'INT' in t:
-        return int(round(value_f))
-    # ENUM and others: cast to int index when close to int; else pass float
+        return 'INT'
     if 'ENUM' in t:
+        return 'ENUM'
+    return 'FLOAT'
+
+def _coerce_for_target(owner, attr: str, idx, value_f: float, cache_key: str = None):
+    # The target type rarely changes between ticks; memoize it by datapath
+    t = _coerce_cache.get(cache_key) if cache_key else None
+    if t is None:
+        t = _infer_target_tag(owner, attr, idx)
+        if cache_key:
+            _coerce_cache[cache_key] = t
+    if t == 'BOOL':
+        return bool(value_f > 0.0)
+    if t == 'INT' or t == 'ENUM':
+        # ENUM: cast to int index
         return int(round(value_f))
     return float(value_f)
 
-def _apply_mapping_value(item, value_f: float):
-    owner, attr, idx = _resolve_owner_attr_idx(item.datapath)
-    coerced = _coerce_for_target(owner, attr, idx, value_f)
+def _apply_resolved(owner, attr, idx, value_f: float, cache_key: str = None):
+    coerced = _coerce_for_target(owner, attr, idx, value_f, cache_key)
+    # Unchanged value: skip the write so no RNA update/depsgraph tag fires
+    if cache_key is not None and _applied_cache.get(cache_key) == coerced:
+        return
     if idx is None:
         setattr(owner, attr, coerced)
     else:
         vec = getattr(owner, attr)
         vec[idx] = coerced
+    if cache_key is not None:
+        _applied_cache[cache_key] = coerced
+
+def _apply_mapping_value(datapath: str, value_f: float):
+    owner, attr, idx = _resolve_owner_attr_idx(datapath)
+    try:
+        _apply_resolved(owner, attr, idx, value_f, datapath)
+    except (AttributeError, ReferenceError):
+        # Cached owner may be stale after undo/file reload; resolve fresh once
+        _resolved_cache.pop(datapath, None)
+        owner, attr, idx = _resolve_owner_attr_idx(datapath)
+        _apply_resolved(owner, attr, idx, value_f, datapath)
 
 def _insert_keyframe_for_absolute(abs_expr: str, frame: int):
     owner, attr, idx = _resolve_owner_attr_idx(abs_expr)
@@ -318,14 +596,23 @@ def _insert_keyframe_for_absolute(abs_expr: str, frame: int):
     except Exception:
         pass
 
+# (data_path, array_index) -> fcurve per action, so mute toggles don't
+# rescan every fcurve of the action for every mapping
+_fc_index: Dict[int, dict] = {}
+
 def _get_fcurve(id_owner, data_path: str, array_index: int):
     ad = getattr(id_owner, "animation_data", None)
     if not ad or not ad.action:
         return None
-    for fc in ad.action.fcurves:
-        if fc.data_path == data_path and fc.array_index == array_index:
-            return fc
-    return None
+    ac = ad.action
+    key = ac.as_pointer()
+    index = _fc_index.get(key)
+    if index is None or (data_path, array_index) not in index:
+        # First sight of this action, or a keyframe_insert just created a
+        # new fcurve: (re)build the index in one pass
+        index = {(fc.data_path, fc.array_index): fc for fc in ac.fcurves}
+        _fc_index[key] = index
+    return index.get((data_path, array_index))
 
 def _set_fcurve_mute_for_path(id_owner, data_path: str, array_index: int, mute: bool):
     fc = _get_fcurve(id_owner, data_path, array_index)
@@ -350,16 +637,38 @@ def _apply_mute_state_all(scn, mute: bool):
     except Exception:
         pass
 
-def _redraw_editors():
+# Redraw throttling: the status label changes far less often than the timer
+# ticks, so cap tag_redraw traffic at ~10 Hz and skip it when nothing visible
+# changed. The matching areas are cached per screen.
+_REDRAW_MIN_INTERVAL = 0.1
+_REDRAW_AREA_TYPES = {'GRAPH_EDITOR', 'DOPESHEET_EDITOR', 'VIEW_3D', 'TIMELINE'}
+_last_redraw_time = 0.0
+_last_status_text = None
+_redraw_areas_key = None
+_redraw_areas = ()
+
+def _redraw_editors(status_text=None):
+    global _last_redraw_time, _last_status_text, _redraw_areas_key, _redraw_areas
+    if status_text is not None:
+        # Timer path: throttle; direct calls (toggles, stop) always redraw
+        now = time.monotonic()
+        if status_text == _last_status_text or (now - _last_redraw_time) < _REDRAW_MIN_INTERVAL:
+            return
+        _last_status_text = status_text
+        _last_redraw_time = now
     try:
         scr = bpy.context.screen
         if not scr:
             return
-        for area in scr.areas:
-            if area.type in {'GRAPH_EDITOR', 'DOPESHEET_EDITOR', 'VIEW_3D', 'TIMELINE'}:
-                area.tag_redraw()
+        key = scr.as_pointer()
+        if key != _redraw_areas_key:
+            _redraw_areas = [a for a in scr.areas if a.type in _REDRAW_AREA_TYPES]
+            _redraw_areas_key = key
+        for area in _redraw_areas:
+            area.tag_redraw()
     except Exception:
-        pass
+        # Cached areas may be stale (e.g. layout changed); rebuild next call
+        _redraw_areas_key = None
 
 def _set_playback_running(should_play: bool):
     try:
@@ -377,6 +686,7 @@ def _set_playback_running(should_play: bool):
 def _record_toggle_update(self, context):
     wm = context.window_manager
     scn = context.scene
+    _fc_index.clear()
     _apply_mute_state_all(scn, wm.oscrec_record_keys)
     _set_playback_running(wm.oscrec_record_keys)
     # If we just turned recording off, unmute to resume live evaluation
@@ -414,7 +724,12 @@ def _start_system():
 def _stop_system():
     global _stop_flag, _rx_thread, _sock
     _stop_flag = True
-    # Force-break the listener by closing the socket immediately
+    # Force-break the blocking recvfrom, then close the socket
+    try:
+        if _sock is not None:
+            _sock.shutdown(socket.SHUT_RDWR)
+    except Exception:
+        pass
     try:
         if _sock is not None:
             _sock.close()
@@ -432,15 +747,22 @@ def _stop_system():
         pass
     try:
         _last_keyed_frame.clear()
+        _applied_cache.clear()
+        _fc_index.clear()
+        _invalidate_compiled()
     except Exception:
         pass
     # Clear rx state so nothing holds last values
     try:
-        with _lock:
-            _rx_values.clear()
-            globals()['_last_value'] = None
+        while True:
+            _rx_q.get_nowait()
+    except queue.Empty:
+        pass
     except Exception:
         pass
+    globals()['_last_value'] = None
+    globals()['_last_status_text'] = None
+    _pending_rx.clear()
     # Turn off recording toggle and unmute curves
     try:
         wm = bpy.context.window_manager if bpy.context is not None else None
@@ -540,8 +862,7 @@ class OSCREC_PT_panel(bpy.types.Panel):
         # Fallback to in-memory last value if the UI property hasn't been updated yet
         if not txt:
             try:
-                with _lock:
-                    lv = _last_value
+                lv = _last_value
                 txt = (f"{lv:.4f}" if lv is not None else "")
             except Exception:
                 pass
@@ -563,16 +884,19 @@ class OSCREC_PG_Mapping(bpy.types.PropertyGroup):
         name="Mute",
         description="Mute/unmute this mapping",
         default=True,
+        update=_invalidate_compiled,
     )
     address: bpy.props.StringProperty(
         name="Address",
         description="The address to listen to.",
         default="",
+        update=_addr_update,
     )
     datapath: bpy.props.StringProperty(
         name="Data Path",
         description="The full data path to map to.",
         default="",
+        update=_datapath_update,
     )
     # Cast mode removed; conversion is auto-inferred from target RNA/property.
 
@@ -592,6 +916,7 @@ class OSCREC_OT_mapping_add(bpy.types.Operator):
         except Exception:
             pass
         scn.oscrec_mappings_index = len(scn.oscrec_mappings) - 1
+        _invalidate_compiled()
         return {'FINISHED'}
 
 class OSCREC_OT_mapping_remove(bpy.types.Operator):
@@ -608,6 +933,7 @@ class OSCREC_OT_mapping_remove(bpy.types.Operator):
         if 0 <= idx < len(scn.oscrec_mappings):
             scn.oscrec_mappings.remove(idx)
             scn.oscrec_mappings_index = min(idx, len(scn.oscrec_mappings) - 1)
+            _invalidate_compiled()
         return {'FINISHED'}
 
 classes = (